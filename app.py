@@ -2,21 +2,26 @@
 Wallpaper Manager - PyQt6 GUI
 """
 
+import hashlib
+import os
 import sys
-from pathlib import Path
 from typing import Optional
 
-from PyQt6.QtCore import Qt, QUrl, QSize
-from PyQt6.QtGui import QIcon, QPixmap
+from PyQt6.QtCore import (
+    Qt, QUrl, QSize, QPoint, QObject, QThread, QThreadPool, QRunnable, QTimer,
+    QFileSystemWatcher,
+    pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QIcon, QImage, QImageReader, QPixmap
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QLabel, QPushButton, QSlider,
-    QFrame, QMessageBox, QLineEdit
+    QFrame, QMessageBox, QLineEdit, QSizePolicy
 )
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PyQt6.QtMultimediaWidgets import QVideoWidget
 
-from config import STATE_FILE
+from config import STATE_FILE, THUMB_CACHE_DIR
 from scanner import WallpaperScanner, Wallpaper
 
 from system import apply_wallpaper, SystemdManager, save_volume, get_volume
@@ -39,17 +44,141 @@ def get_current_wallpaper() -> Optional[str]:
     if not status['active']:
         return None
 
-    if STATE_FILE.exists():
+    try:
         path = STATE_FILE.read_text().strip()
-        if path and Path(path).exists():
-            return path
+    except FileNotFoundError:
+        return None
+
+    if path and os.path.exists(path):
+        return path
     return None
 
 
 def clear_current_wallpaper():
     """Clear the saved current wallpaper"""
-    if STATE_FILE.exists():
-        STATE_FILE.unlink()
+    STATE_FILE.unlink(missing_ok=True)
+
+
+class ScannerWorker(QObject):
+    """Runs WallpaperScanner.scan off the GUI thread"""
+
+    finished = pyqtSignal(list, list)
+
+    @pyqtSlot()
+    def run(self):
+        """Scan Workshop folders and emit the wallpapers and visited folders"""
+        # Always emit, MainWindow only starts new scans once this one finishes
+        try:
+            wallpapers, watch_paths = WallpaperScanner.scan_with_folders(filter_videos_only=True)
+        except Exception as e:
+            print(f"Wallpaper scan failed: {e!r}")
+            wallpapers, watch_paths = [], []
+        self.finished.emit(wallpapers, watch_paths)
+
+
+def load_thumbnail(preview_path: str, size: QSize) -> Optional[QImage]:
+    """
+    Load a scaled thumbnail, using the on-disk cache when possible
+    Safe to call from worker threads, only QImage is used
+    :param preview_path: Full path to the preview image
+    :param size: Thumbnail size
+    :return: scaled image or None if the image can't be loaded
+    """
+    try:
+        mtime = os.path.getmtime(preview_path)
+    except OSError:
+        return None
+
+    key = hashlib.blake2b(
+        f"{preview_path}:{mtime}:{size.width()}x{size.height()}".encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_file = THUMB_CACHE_DIR / f"{key}.png"
+
+    if cache_file.exists():
+        cached = QImage(str(cache_file))
+        if not cached.isNull():
+            return cached
+
+    # Decode at reduced resolution (JPEG can scale in the DCT domain),
+    # so the full-size preview buffer is never allocated
+    intermediate_size = size * 4
+    reader = QImageReader(preview_path)
+    reader.setAutoTransform(True)
+    source_size = reader.size()
+    if (source_size.isValid()
+            and (source_size.width() > intermediate_size.width()
+                 or source_size.height() > intermediate_size.height())):
+        reader.setScaledSize(
+            source_size.scaled(intermediate_size, Qt.AspectRatioMode.KeepAspectRatio)
+        )
+
+    image = reader.read()
+    if image.isNull():
+        return None
+
+    # Two-stage downscale: cheap pass to ~4x the target, smooth pass to final size
+    if (image.width() > intermediate_size.width()
+            or image.height() > intermediate_size.height()):
+        image = image.scaled(
+            intermediate_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        )
+    scaled = image.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+    try:
+        THUMB_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        print(f"Failed to cache thumbnail: {e}")
+    else:
+        # QImage.save reports failure through its return value
+        if not scaled.save(str(cache_file), "PNG"):
+            print(f"Failed to cache thumbnail: could not write {cache_file}")
+
+    return scaled
+
+
+class ThumbnailSignals(QObject):
+    """Carries thumbnails from ThumbnailLoader back to the GUI thread"""
+
+    loaded = pyqtSignal(str, QImage)
+
+
+class ThumbnailLoader(QRunnable):
+    """Loads one thumbnail on a QThreadPool worker"""
+
+    def __init__(self, preview_path: str, size: QSize, signals: ThumbnailSignals):
+        super().__init__()
+        self.preview_path = preview_path
+        self.size = size
+        self.signals = signals
+
+    def run(self):
+        image = load_thumbnail(self.preview_path, self.size)
+        self.signals.loaded.emit(self.preview_path, image if image is not None else QImage())
+
+
+class ApplySignals(QObject):
+    """Reports ApplyWorker results back to the GUI thread"""
+
+    finished = pyqtSignal(bool, str)
+
+
+class ApplyWorker(QRunnable):
+    """Runs apply_wallpaper on a QThreadPool worker"""
+
+    def __init__(self, video_path: str, signals: ApplySignals):
+        super().__init__()
+        self.video_path = video_path
+        self.signals = signals
+
+    def run(self):
+        self.signals.finished.emit(apply_wallpaper(self.video_path), self.video_path)
 
 
 # ============================================================
@@ -184,42 +313,135 @@ class WallpaperListWidget(QListWidget):
     """Custom list widget for wallpapers with thumbnails"""
 
     THUMB_SIZE = QSize(80, 45)  # 16:9 aspect ratio
+    THUMB_BUFFER_ROWS = 3  # rows loaded above/below the viewport
+    PREVIEW_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    # Shared dark placeholder, built on first use (needs a QApplication)
+    _PLACEHOLDER_ICON: Optional[QIcon] = None
 
     def __init__(self):
         super().__init__()
         self.setIconSize(self.THUMB_SIZE)
         self.setSpacing(4)
 
+        # Items waiting for their thumbnail, keyed by preview path
+        self._items_by_preview: dict[str, list[QListWidgetItem]] = {}
+        self._requested_previews: set[str] = set()
+
+        self._thumb_pool = QThreadPool(self)
+        self._thumb_signals = ThumbnailSignals(self)
+        self._thumb_signals.loaded.connect(self._on_thumbnail_loaded)
+
+        # Coalesces scroll/resize/insert events into one visibility check
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(0)
+        self._thumb_timer.timeout.connect(self._load_visible_thumbnails)
+
+        self.verticalScrollBar().valueChanged.connect(self._thumb_timer.start)
+
     def add_wallpaper(self, wallpaper: Wallpaper, is_current: bool = False):
         """Add a wallpaper with thumbnail to the list"""
-        # Show indicator if this is the running wallpaper
-        display_name = f"● {wallpaper.title}" if is_current else wallpaper.title
-
-        item = QListWidgetItem(display_name)
+        item = QListWidgetItem()
         item.setData(Qt.ItemDataRole.UserRole, wallpaper)
+        self.set_item_current(item, is_current)
+
+        # Dark placeholder until the thumbnail is loaded
+        if WallpaperListWidget._PLACEHOLDER_ICON is None:
+            placeholder = QPixmap(self.THUMB_SIZE)
+            placeholder.fill(Qt.GlobalColor.darkGray)
+            WallpaperListWidget._PLACEHOLDER_ICON = QIcon(placeholder)
+        item.setIcon(WallpaperListWidget._PLACEHOLDER_ICON)
+
+        # Thumbnail is loaded once the item scrolls into view
+        if wallpaper.preview_path:
+            item.setData(self.PREVIEW_ROLE, wallpaper.preview_path)
+            self._items_by_preview.setdefault(wallpaper.preview_path, []).append(item)
+
+        self.addItem(item)
+        self._thumb_timer.start()
+        return item
+
+    def clear(self):
+        """Clear the list and forget pending thumbnails"""
+        self._items_by_preview = {}
+        self._requested_previews = set()
+        super().clear()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._thumb_timer.start()
+
+    def _visible_row(self, y: int, default: int) -> int:
+        """Row at viewport height y, looking past the spacing between items"""
+        x = self.viewport().width() // 2
+        for offset in (0, self.spacing() * 2, -self.spacing() * 2):
+            index = self.indexAt(QPoint(x, y + offset))
+            if index.isValid():
+                return index.row()
+        return default
+
+    def _load_visible_thumbnails(self):
+        """Queue thumbnail loading for visible rows plus a small buffer"""
+        count = self.count()
+        if not count:
+            return
+
+        viewport = self.viewport().rect()
+        first = self._visible_row(viewport.top(), 0)
+        last = self._visible_row(viewport.bottom(), count - 1)
+
+        first = max(0, first - self.THUMB_BUFFER_ROWS)
+        last = min(count - 1, last + self.THUMB_BUFFER_ROWS)
+
+        for row in range(first, last + 1):
+            preview_path = self.item(row).data(self.PREVIEW_ROLE)
+            if not preview_path or preview_path in self._requested_previews:
+                continue
+
+            self._requested_previews.add(preview_path)
+            self._thumb_pool.start(ThumbnailLoader(preview_path, self.THUMB_SIZE, self._thumb_signals))
+
+    def _on_thumbnail_loaded(self, preview_path: str, image: QImage):
+        """Set a loaded thumbnail on every item using it"""
+        items = self._items_by_preview.pop(preview_path, None)
+        if not items or image.isNull():
+            return
+
+        icon = QIcon(QPixmap.fromImage(image))
+        for item in items:
+            item.setIcon(icon)
+
+    def reload_thumbnail(self, item: QListWidgetItem):
+        """Load an item's thumbnail again, e.g. after its preview file was replaced"""
+        preview_path = item.data(self.PREVIEW_ROLE)
+        if not preview_path:
+            return
+
+        self._requested_previews.discard(preview_path)
+        items = self._items_by_preview.setdefault(preview_path, [])
+        if item not in items:
+            items.append(item)
+        self._thumb_timer.start()
+
+    @staticmethod
+    def set_item_current(item: QListWidgetItem, is_current: bool):
+        """Show or hide the running wallpaper indicator on an item"""
+        wallpaper = item.data(Qt.ItemDataRole.UserRole)
+        item.setText(f"● {wallpaper.title}" if is_current else wallpaper.title)
 
         # Set green color for running wallpaper
         if is_current:
             item.setForeground(Qt.GlobalColor.green)
-
-        # Load thumbnail
-        if wallpaper.preview_path and Path(wallpaper.preview_path).exists():
-            pixmap = QPixmap(wallpaper.preview_path)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.THUMB_SIZE,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                item.setIcon(QIcon(scaled))
         else:
-            # Dark placeholder
-            placeholder = QPixmap(self.THUMB_SIZE)
-            placeholder.fill(Qt.GlobalColor.darkGray)
-            item.setIcon(QIcon(placeholder))
+            item.setData(Qt.ItemDataRole.ForegroundRole, None)
 
+    def show_placeholder(self, text: str):
+        """Replace list contents with a single non-selectable message"""
+        self.clear()
+        item = QListWidgetItem(text)
+        item.setFlags(Qt.ItemFlag.NoItemFlags)
         self.addItem(item)
-        return item
 
     def get_selected(self) -> Optional[Wallpaper]:
         """Get currently selected wallpaper"""
@@ -251,6 +473,12 @@ class PreviewWidget(QFrame):
         self.player.setAudioOutput(self.audio)
         self.player.setVideoOutput(self.video_widget)
         self.player.setLoops(QMediaPlayer.Loops.Infinite)
+        self.player.mediaStatusChanged.connect(self._on_media_status_changed)
+
+        # Poster - preview image shown while the video pipeline loads
+        self.poster = QLabel()
+        self.poster.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.poster.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Ignored)
 
         # Placeholder label
         self.placeholder = QLabel("Select a wallpaper")
@@ -258,24 +486,58 @@ class PreviewWidget(QFrame):
         self.placeholder.setStyleSheet("color: #6b7280; font-size: 14px;")
 
         layout.addWidget(self.placeholder)
+        layout.addWidget(self.poster)
         layout.addWidget(self.video_widget)
+        self.poster.hide()
         self.video_widget.hide()
 
-    def load_video(self, path: str):
-        """Load and play a video for preview"""
+    def load_video(self, path: str, poster_path: Optional[str] = None):
+        """
+        Load and play a video for preview
+        :param path: Full path to the video
+        :param poster_path: Preview image shown until the first frames are buffered
+        """
         # Stop and release previous video to free GPU memory
         self.player.stop()
         self.player.setSource(QUrl())
 
         self.placeholder.hide()
-        self.video_widget.show()
+        if poster_path and self._show_poster(poster_path):
+            self.video_widget.hide()
+        else:
+            self.poster.hide()
+            self.video_widget.show()
+
         self.player.setSource(QUrl.fromLocalFile(path))
         self.player.play()
 
+    def _show_poster(self, poster_path: str) -> bool:
+        """Show the poster image scaled to the preview area, False if it can't be read"""
+        reader = QImageReader(poster_path)
+        reader.setAutoTransform(True)
+        source_size = reader.size()
+        if source_size.isValid():
+            reader.setScaledSize(source_size.scaled(self.size(), Qt.AspectRatioMode.KeepAspectRatio))
+
+        image = reader.read()
+        if image.isNull():
+            return False
+
+        self.poster.setPixmap(QPixmap.fromImage(image))
+        self.poster.show()
+        return True
+
+    def _on_media_status_changed(self, status: QMediaPlayer.MediaStatus):
+        """Swap the poster for the video once frames are ready"""
+        if status == QMediaPlayer.MediaStatus.BufferedMedia and self.poster.isVisible():
+            self.poster.hide()
+            self.video_widget.show()
+
     def stop(self):
         """Stop playback and show placeholder"""
         self.player.stop()
         self.player.setSource(QUrl())
+        self.poster.hide()
         self.video_widget.hide()
         self.placeholder.show()
 
@@ -399,6 +661,18 @@ class SidebarWidget(QWidget):
         """Clear the list"""
         self.list_widget.clear()
 
+    def set_item_current(self, item: QListWidgetItem, is_current: bool):
+        """Show or hide the running wallpaper indicator on an item"""
+        self.list_widget.set_item_current(item, is_current)
+
+    def reload_thumbnail(self, item: QListWidgetItem):
+        """Load an item's thumbnail again"""
+        self.list_widget.reload_thumbnail(item)
+
+    def show_scanning(self):
+        """Show a placeholder while wallpapers are being scanned"""
+        self.list_widget.show_placeholder("Scanning…")
+
     def get_selected(self) -> Optional[Wallpaper]:
         """Get currently selected wallpaper"""
         return self.list_widget.get_selected()
@@ -416,6 +690,43 @@ class MainWindow(QMainWindow):
         self.current_wallpaper: Optional[Wallpaper] = None
         self.running_wallpaper_path: Optional[str] = None
 
+        self._scan_thread: Optional[QThread] = None
+        self._scan_worker: Optional[ScannerWorker] = None
+        self._rescan_pending = False
+
+        # Items currently in the sidebar, keyed by file_path
+        self._items: dict[str, QListWidgetItem] = {}
+        self._marked_wallpaper_path: Optional[str] = None
+
+        self._apply_signals = ApplySignals(self)
+        self._apply_signals.finished.connect(self._on_apply_finished)
+
+        # Delays preview loading while the selection is still moving
+        self._pending_preview: Optional[Wallpaper] = None
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(200)
+        self._preview_timer.timeout.connect(self._load_pending_preview)
+
+        # Rescans when the Workshop folder changes, so Refresh is rarely needed
+        self._watcher = QFileSystemWatcher(self)
+        self._watch_timer = QTimer(self)
+        self._watch_timer.setSingleShot(True)
+        self._watch_timer.setInterval(500)
+        self._watch_timer.timeout.connect(self._load_wallpapers)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+
+        # Folders changed since the last scan started / seen by the running scan
+        self._changed_folders: set[str] = set()
+        self._scan_changed_folders: set[str] = set()
+
+        # Coalesces volume slider ticks into a single write
+        self._volume_save_timer = QTimer(self)
+        self._volume_save_timer.setSingleShot(True)
+        self._volume_save_timer.setInterval(250)
+        self._volume_save_timer.timeout.connect(self._save_volume)
+
         self._setup_ui()
         self._connect_signals()
         self._load_wallpapers()
@@ -458,21 +769,74 @@ class MainWindow(QMainWindow):
     def _connect_signals(self):
         """Connect UI signals to handlers"""
         self.sidebar.list_widget.currentItemChanged.connect(self._on_wallpaper_selected)
-        self.sidebar.refresh_btn.clicked.connect(self._load_wallpapers)
+        self.sidebar.refresh_btn.clicked.connect(self._on_refresh)
 
         self.controls.volume_slider.valueChanged.connect(self._on_volume_changed)
         self.controls.apply_btn.clicked.connect(self._on_apply)
         self.controls.stop_btn.clicked.connect(self._on_stop)
 
+    def _on_refresh(self):
+        """Re-probe the Workshop location and rescan"""
+        WallpaperScanner.clear_workshop_path_cache()
+        self._load_wallpapers()
+
     def _load_wallpapers(self):
-        """Scan and load wallpapers using WallpaperScanner"""
-        self.sidebar.clear()
+        """Scan wallpapers in a background thread using WallpaperScanner"""
+        if self._scan_thread is not None:
+            # A scan is already running, repeat it once it finishes
+            self._rescan_pending = True
+            return
+
+        # Keep the existing list on screen, it's usually reused as-is
+        if not self._items:
+            self.sidebar.show_scanning()
 
         # Get currently running wallpaper
         self.running_wallpaper_path = get_current_wallpaper()
 
+        # Changes from here on are picked up by this scan
+        self._scan_changed_folders |= self._changed_folders
+        self._changed_folders = set()
+
         # Scan for wallpapers
-        wallpapers = WallpaperScanner.scan(filter_videos_only=True)
+        self._scan_thread = QThread(self)
+        self._scan_worker = ScannerWorker()
+        self._scan_worker.moveToThread(self._scan_thread)
+
+        self._scan_thread.started.connect(self._scan_worker.run)
+        self._scan_worker.finished.connect(self._on_scan_complete)
+        self._scan_worker.finished.connect(self._scan_thread.quit)
+        self._scan_thread.finished.connect(self._scan_worker.deleteLater)
+        self._scan_thread.finished.connect(self._scan_thread.deleteLater)
+
+        self._scan_thread.start()
+
+    def _on_scan_complete(self, wallpapers: list[Wallpaper], watch_paths: list[str]):
+        """Populate the sidebar with scan results"""
+        self._scan_thread = None
+        self._scan_worker = None
+
+        if self._rescan_pending:
+            self._rescan_pending = False
+            self._load_wallpapers()
+            return
+
+        self._update_watched_paths(watch_paths)
+        changed_folders = self._scan_changed_folders
+        self._scan_changed_folders = set()
+
+        if self._items and self._is_same_scan(wallpapers):
+            self._update_current_marker()
+
+            # A replaced preview image leaves the Wallpaper unchanged
+            for wallpaper in wallpapers:
+                if wallpaper.folder_path in changed_folders:
+                    self.sidebar.reload_thumbnail(self._items[wallpaper.file_path])
+            return
+
+        self.sidebar.clear()
+        self._items = {}
+        self._marked_wallpaper_path = self.running_wallpaper_path
 
         if not wallpapers:
             workshop_path = WallpaperScanner.get_workshop_path()
@@ -491,7 +855,58 @@ class MainWindow(QMainWindow):
                     self.running_wallpaper_path is not None
                     and wallpaper.file_path == self.running_wallpaper_path
             )
-            self.sidebar.add_wallpaper(wallpaper, is_current)
+            self._items[wallpaper.file_path] = self.sidebar.add_wallpaper(wallpaper, is_current)
+
+    def _on_directory_changed(self, path: str):
+        """Remember the changed folder and schedule a rescan"""
+        self._changed_folders.add(path)
+        self._watch_timer.start()
+
+    def _on_file_changed(self, path: str):
+        """A project.json or preview was rewritten in place, rescan its folder"""
+        self._on_directory_changed(os.path.dirname(path))
+
+    def _update_watched_paths(self, watch_paths: list[str]):
+        """
+        Watch the Workshop folder, every folder the scan visited (including
+        skipped ones) and their project.json/preview files, so a project.json
+        that appears, gets fixed or a preview that gets replaced triggers a rescan
+        """
+        wanted = set(watch_paths)
+        workshop_path = WallpaperScanner.get_workshop_path()
+        if workshop_path:
+            wanted.add(workshop_path)
+
+        watched = set(self._watcher.directories()) | set(self._watcher.files())
+        if watched - wanted:
+            self._watcher.removePaths(list(watched - wanted))
+        if wanted - watched:
+            self._watcher.addPaths(list(wanted - watched))
+
+    def _is_same_scan(self, wallpapers: list[Wallpaper]) -> bool:
+        """Check whether a scan result matches the wallpapers already listed"""
+        if len(wallpapers) != len(self._items):
+            return False
+
+        for wallpaper in wallpapers:
+            item = self._items.get(wallpaper.file_path)
+            if item is None or item.data(Qt.ItemDataRole.UserRole) != wallpaper:
+                return False
+        return True
+
+    def _update_current_marker(self):
+        """Move the running indicator without rebuilding the list"""
+        old_path = self._marked_wallpaper_path
+        new_path = self.running_wallpaper_path
+        if old_path == new_path:
+            return
+
+        if old_path in self._items:
+            self.sidebar.set_item_current(self._items[old_path], False)
+        if new_path in self._items:
+            self.sidebar.set_item_current(self._items[new_path], True)
+
+        self._marked_wallpaper_path = new_path
 
     def _on_wallpaper_selected(self, current: QListWidgetItem, previous: QListWidgetItem):
         """Handle wallpaper selection change"""
@@ -507,13 +922,25 @@ class MainWindow(QMainWindow):
         # Update controls
         self.controls.set_wallpaper_info(wallpaper.title, wallpaper.file_path)
 
-        # Load preview
-        self.preview.load_video(wallpaper.file_path)
+        # Load preview once the selection settles
+        self._pending_preview = wallpaper
+        self._preview_timer.start()
+
+    def _load_pending_preview(self):
+        """Load the preview for the last selected wallpaper"""
+        wallpaper = self._pending_preview
+        self._pending_preview = None
+        if wallpaper:
+            self.preview.load_video(wallpaper.file_path, wallpaper.preview_path)
 
     def _on_volume_changed(self, value: int):
         """Handle volume slider change - only saves to config"""
         self.controls.volume_value.setText(f"{value}%")
-        save_volume(value)
+        self._volume_save_timer.start()
+
+    def _save_volume(self):
+        """Write the current slider volume to config"""
+        save_volume(self.controls.volume_slider.value())
 
     def _on_apply(self):
         """Apply the selected wallpaper"""
@@ -521,11 +948,21 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "No Selection", "Please select a wallpaper first.")
             return
 
-        success = apply_wallpaper(self.current_wallpaper.file_path)
+        # systemctl calls run off the GUI thread
+        self.controls.apply_btn.setEnabled(False)
+        self.controls.stop_btn.setEnabled(False)
+        QThreadPool.globalInstance().start(
+            ApplyWorker(self.current_wallpaper.file_path, self._apply_signals)
+        )
+
+    def _on_apply_finished(self, success: bool, video_path: str):
+        """Handle the result of applying a wallpaper"""
+        self.controls.apply_btn.setEnabled(True)
+        self.controls.stop_btn.setEnabled(True)
 
         if success:
             # Save state and refresh list to update indicators
-            save_current_wallpaper(self.current_wallpaper.file_path)
+            save_current_wallpaper(video_path)
             self._load_wallpapers()
         else:
             QMessageBox.critical(
@@ -545,7 +982,15 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """Clean up on close"""
+        self._preview_timer.stop()
+        self._watch_timer.stop()
         self.preview.stop()
+        if self._volume_save_timer.isActive():
+            self._volume_save_timer.stop()
+            self._save_volume()
+        if self._scan_thread is not None:
+            self._scan_thread.quit()
+            self._scan_thread.wait()
         super().closeEvent(event)
 
 
@@ -46,6 +46,16 @@ echo "Installing dependencies..."
 pip install --upgrade pip
 pip install -r requirements.txt
 
+# Compile scanner with mypyc (optional, app falls back to scanner.py)
+echo "Compiling scanner with mypyc..."
+rm -f "$APP_DIR"/scanner.cpython-*.so
+if pip install mypy && (cd "$APP_DIR" && mypyc scanner.py); then
+  echo "Scanner compiled"
+else
+  echo "mypyc compilation failed, using pure Python scanner"
+  rm -f "$APP_DIR"/scanner.cpython-*.so
+fi
+
 # Desktop shortcut
 echo "Creating desktop shortcut..."
 
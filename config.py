@@ -8,7 +8,8 @@ WORKSHOP_PATHS = [
 ]
 
 VALID_VIDEO_EXTENSIONS: list[str] = ['.mp4', '.webm']
-PREVIEW_EXTENSIONS: list[str] = ['preview.jpg', 'preview.png', 'preview.gif', 'preview.jpeg']
+PROJECT_JSON_MAX_SIZE: int = 1 << 20  # project.json files are always tiny
+PREVIEW_EXTENSIONS: frozenset[str] = frozenset({'preview.jpg', 'preview.png', 'preview.gif', 'preview.jpeg'})
 
 SERVICE_SCRIPT: str = os.path.abspath('pivio-autostart.sh')
 SERVICE_NAME: str = 'pivio-autostart.service'
@@ -16,4 +17,5 @@ SERVICE_PATH: Path =  Path.home() / '.config/systemd/user' / SERVICE_NAME
 SERVICE_TEMPLATE_PATH: Path = Path("pivio.service.template")
 
 STATE_FILE = Path.home() / ".config" / "wallpaper-manager" / "current.txt"
-VOLUME_FILE = Path.home() / ".config" / "wallpaper-manager" / "volume.txt"
\ No newline at end of file
+VOLUME_FILE = Path.home() / ".config" / "wallpaper-manager" / "volume.txt"
+THUMB_CACHE_DIR = Path.home() / ".cache" / "wallpaper-manager" / "thumbs"
@@ -1,11 +1,23 @@
 import os
 import json
-from dataclasses import dataclass
+import stat
+from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, ClassVar
 
-from config import WORKSHOP_PATHS, VALID_VIDEO_EXTENSIONS, PREVIEW_EXTENSIONS
+from config import WORKSHOP_PATHS, VALID_VIDEO_EXTENSIONS, PREVIEW_EXTENSIONS, PROJECT_JSON_MAX_SIZE
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
-@dataclass
+# project.json path -> (mtime_ns, parsed data), kept across refreshes
+_PROJECT_CACHE: dict[str, tuple[int, dict[str, Any] | None]] = {}
+
+
+@dataclass(slots=True, frozen=True)
 class Wallpaper:
     """Represents a single wallpaper from Steam Workshop"""
     title: str
@@ -13,48 +25,91 @@ class Wallpaper:
     preview_path: str | None
     folder_path: str
     wallpaper_type: str  # 'video', 'scene', 'web', 'image'
+    title_lower: str = field(init=False, repr=False, compare=False)  # sort key, lowercased once
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass, so bypass __setattr__ for the derived field
+        object.__setattr__(self, 'title_lower', self.title.lower())
+
+
+@lru_cache(maxsize=1)
+def _resolve_workshop_path(workshop_paths: tuple[str, ...]) -> None | str:
+    """Return the first existing Workshop path, cached between scans"""
+    for workshop_path in workshop_paths:
+        if os.path.isdir(workshop_path):
+            return workshop_path
+    else:
+        return None
 
 
 class WallpaperScanner:
     """Scans Steam Workshop directory for Wallpaper Engine wallpapers"""
-    workshop_paths = WORKSHOP_PATHS
-    valid_video_extensions = VALID_VIDEO_EXTENSIONS
-    valid_preview_extensions = PREVIEW_EXTENSIONS
+    workshop_paths: ClassVar[list[str]] = WORKSHOP_PATHS
+    valid_video_extensions: ClassVar[list[str]] = VALID_VIDEO_EXTENSIONS
+    valid_preview_extensions: ClassVar[frozenset[str]] = PREVIEW_EXTENSIONS
+    max_project_json_size: ClassVar[int] = PROJECT_JSON_MAX_SIZE
 
     @classmethod
     def get_workshop_path(cls) -> None | str:
         """Find which Steam Workshop path exists on this system"""
-        for workshop_path in cls.workshop_paths:
-            if os.path.isdir(workshop_path):
-                return workshop_path
-        else:
-            return None
+        return _resolve_workshop_path(tuple(cls.workshop_paths))
 
     @classmethod
-    def find_preview(cls, folder_path: str) -> None | str:
-        """Look for preview image in multiple formats"""
-        preview_files = os.listdir(folder_path)
-        for preview_file in preview_files:
-            if preview_file in cls.valid_preview_extensions:
-                return os.path.join(folder_path, preview_file)
-        else:
-            return None
+    def clear_workshop_path_cache(cls):
+        """Forget the cached Workshop path so the next lookup probes the disk again"""
+        _resolve_workshop_path.cache_clear()
 
     @classmethod
-    def parse_project_json(cls, folder_path: str) -> None | dict:
-        """Parse the project.json file in a wallpaper folder"""
-        project_json_path = os.path.join(folder_path, "project.json")
+    def scan_folder(cls, folder_path: str) -> tuple[None | str, None | str]:
+        """
+        Lists a wallpaper folder once, looking for project.json and a preview image
+        :param folder_path: Full path to the wallpaper folder
+        :return: (project.json path, preview path), either may be None
+        """
+        project_json_path: str | None = None
+        preview_path: str | None = None
 
-        if os.path.exists(project_json_path):
-            with open(project_json_path, "r", encoding='utf-8') as f:
-                try:
-                    json_data = json.load(f)
-                    return json_data
-                except (json.JSONDecodeError, IOError):
-                    return None
-        else:
+        try:
+            with os.scandir(folder_path) as entries:
+                for entry in entries:
+                    if entry.name == "project.json":
+                        project_json_path = entry.path
+                    elif preview_path is None and entry.name in cls.valid_preview_extensions:
+                        preview_path = entry.path
+        except OSError:
+            return None, None
+
+        return project_json_path, preview_path
+
+    @classmethod
+    def parse_project_json(cls, project_json_path: str) -> None | dict[str, Any]:
+        """Parse a wallpaper's project.json file, reusing the result until it changes"""
+        try:
+            st = os.stat(project_json_path)
+        except OSError:
+            return None
+
+        mtime = st.st_mtime_ns
+        cached = _PROJECT_CACHE.get(project_json_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        # Reject broken/huge files before reading them
+        if st.st_size > cls.max_project_json_size:
+            _PROJECT_CACHE[project_json_path] = (mtime, None)
             return None
 
+        try:
+            with open(project_json_path, "rb") as f:
+                data = f.read()
+            json_data: dict[str, Any] | None = orjson.loads(data) if orjson is not None else json.loads(data)
+        except (ValueError, OSError):
+            # orjson.JSONDecodeError and json.JSONDecodeError are both ValueErrors
+            json_data = None
+
+        _PROJECT_CACHE[project_json_path] = (mtime, json_data)
+        return json_data
+
     @classmethod
     def scan(cls, filter_videos_only: bool = True) -> list[Wallpaper]:
         """
@@ -62,53 +117,88 @@ class WallpaperScanner:
         :param filter_videos_only: if True skips non-video types
         :return: list Wallpaper objects
         """
-        wallpapers = []
+        return cls.scan_with_folders(filter_videos_only)[0]
+
+    @classmethod
+    def scan_with_folders(cls, filter_videos_only: bool = True) -> tuple[list[Wallpaper], list[str]]:
+        """
+        Scans Workshop folders, also reporting every path worth watching for changes
+        :param filter_videos_only: if True skips non-video types
+        :return: (list Wallpaper objects, paths of all wallpaper folders including skipped ones,
+                  plus their project.json and preview files)
+        """
+        wallpapers: list[Wallpaper] = []
+        watch_paths: list[str] = []
         workshop_path = cls.get_workshop_path()
 
         if not workshop_path:
-            return wallpapers
+            return wallpapers, watch_paths
+
+        try:
+            wallpaper_folders = os.scandir(workshop_path)
+        except OSError:
+            # Cached path went away (e.g. Steam library moved), re-probe next time
+            cls.clear_workshop_path_cache()
+            return wallpapers, watch_paths
+
+        with wallpaper_folders:
+            for wallpaper_folder in wallpaper_folders:
+                if not wallpaper_folder.is_dir():
+                    continue
+
+                wallpaper_folder_path = wallpaper_folder.path
+                watch_paths.append(wallpaper_folder_path)
+                project_json_path, preview = cls.scan_folder(wallpaper_folder_path)
 
-        for wallpaper_folder in os.listdir(workshop_path):
+                # In-place rewrites only show up on the files themselves
+                if preview:
+                    watch_paths.append(preview)
 
-            project_json = cls.parse_project_json(os.path.join(workshop_path, wallpaper_folder))
-            wallpaper_folder_path = os.path.join(workshop_path, wallpaper_folder)
+                if not project_json_path:
+                    continue
 
-            if not project_json:
-                continue
+                watch_paths.append(project_json_path)
 
-            title = project_json.get('title')
-            file_name = project_json.get('file')
-            wallpaper_type = project_json.get('type')
+                project_json = cls.parse_project_json(project_json_path)
 
-            if filter_videos_only:
-                # Skip non-video types
-                if wallpaper_type.lower() in ['scene', 'web']:
+                if not project_json:
                     continue
 
-                # Check file extension
-                file_ext = os.path.splitext(file_name)[1].lower()
-                if file_ext not in cls.valid_video_extensions:
-                    continue
+                title = project_json.get('title', '')
+                file_name = project_json.get('file', '')
+                wallpaper_type = project_json.get('type', '')
 
-            full_file_path = os.path.join(workshop_path, wallpaper_folder, file_name)
+                if filter_videos_only:
+                    # Skip non-video types
+                    if wallpaper_type.lower() in ['scene', 'web']:
+                        continue
 
-            if not os.path.isfile(full_file_path):
-                continue
+                    # Check file extension
+                    dot = file_name.rfind('.')
+                    file_ext = file_name[dot:].lower() if dot != -1 else ''
+                    if file_ext not in cls.valid_video_extensions:
+                        continue
 
-            preview = cls.find_preview(wallpaper_folder_path)
+                full_file_path = os.path.join(wallpaper_folder_path, file_name)
+
+                try:
+                    if not stat.S_ISREG(os.stat(full_file_path).st_mode):
+                        continue
+                except OSError:
+                    continue
 
-            wallpapers.append(Wallpaper(
-                title=title,
-                file_path=full_file_path,
-                preview_path=preview,
-                folder_path=wallpaper_folder_path,
-                wallpaper_type=wallpaper_type
-            ))
+                wallpapers.append(Wallpaper(
+                    title=title,
+                    file_path=full_file_path,
+                    preview_path=preview,
+                    folder_path=wallpaper_folder_path,
+                    wallpaper_type=wallpaper_type
+                ))
 
         # Sort by title
-        wallpapers.sort(key=lambda w: w.title.lower())
+        wallpapers.sort(key=attrgetter('title_lower'))
 
-        return wallpapers
+        return wallpapers, watch_paths
 
 
 if __name__ == "__main__":
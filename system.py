@@ -1,9 +1,259 @@
 import os
+import select
+import shlex
 import subprocess
+import threading
+import time
 from pathlib import Path
 
 from config import SERVICE_PATH, SERVICE_TEMPLATE_PATH, SERVICE_SCRIPT, SERVICE_NAME, VOLUME_FILE
 
+try:
+    from jeepney import DBusAddress, DBusErrorResponse, MatchRule, Properties, new_method_call
+    from jeepney.bus_messages import message_bus
+    from jeepney.io.blocking import open_dbus_connection
+    from jeepney.wrappers import unwrap_msg
+except ImportError:
+    open_dbus_connection = None
+
+STATUS_CACHE_TTL: float = 0.5  # seconds
+
+# (time.monotonic() of the check, status dict), reset by service actions
+_status_cache: tuple[float, dict] | None = None
+# Bumped on every invalidation, so a status read that started before a
+# service action can't store its stale result afterwards
+_status_generation = 0
+_status_lock = threading.Lock()
+
+
+def _invalidate_status_cache():
+    """Make the next get_service_status call query systemd"""
+    global _status_cache, _status_generation
+    with _status_lock:
+        _status_cache = None
+        _status_generation += 1
+
+
+SYSTEMD_BUS_NAME = 'org.freedesktop.systemd1'
+SYSTEMD_PATH = '/org/freedesktop/systemd1'
+SYSTEMD_MANAGER_INTERFACE = 'org.freedesktop.systemd1.Manager'
+SYSTEMD_CALL_TIMEOUT: float = 10  # seconds
+JOB_POLL_INTERVAL: float = 0.05  # seconds between job checks, the bus lock is free meanwhile
+
+# States `systemctl is-enabled` reports with exit code 0
+ENABLED_STATES = frozenset({
+    'enabled', 'enabled-runtime', 'alias', 'static', 'indirect', 'generated', 'transient'
+})
+
+# Session bus connection, opened on first use and shared by all calls
+_bus_connection = None
+_bus_lock = threading.Lock()
+
+
+class SystemdBusError(Exception):
+    """systemd rejected a D-Bus call"""
+
+
+class SystemdBusUnavailable(Exception):
+    """No D-Bus connection could be opened, callers fall back to systemctl"""
+
+
+def _systemd_call(method: str, signature: str = '', body: tuple = (),
+                  path: str = SYSTEMD_PATH, interface: str = SYSTEMD_MANAGER_INTERFACE) -> tuple:
+    """
+    Call a systemd user manager method over the session D-Bus
+    :raises SystemdBusUnavailable: if no connection could be opened
+    :raises OSError: if the call was sent but failed or timed out
+    :raises SystemdBusError: if systemd returned an error
+    :return: reply body
+    """
+    if open_dbus_connection is None:
+        raise SystemdBusUnavailable("jeepney is not installed")
+
+    address = DBusAddress(path, bus_name=SYSTEMD_BUS_NAME, interface=interface)
+    message = new_method_call(address, method, signature, body)
+    return _send(message)
+
+
+def _get_unit_property(unit_path: str, name: str):
+    """Read a property of a loaded systemd unit"""
+    address = DBusAddress(unit_path, bus_name=SYSTEMD_BUS_NAME, interface='org.freedesktop.systemd1.Unit')
+    _signature, value = _send(Properties(address).get(name))[0]
+    return value
+
+
+def _get_connection():
+    """Return the shared connection, opening it if needed. Caller holds _bus_lock"""
+    global _bus_connection
+    if _bus_connection is None:
+        if open_dbus_connection is None:
+            raise SystemdBusUnavailable("jeepney is not installed")
+        try:
+            connection = open_dbus_connection(bus='SESSION')
+        except (KeyError, OSError) as e:
+            # KeyError: DBUS_SESSION_BUS_ADDRESS not set
+            raise SystemdBusUnavailable(f"No session bus: {e}") from e
+
+        # Receive JobRemoved so unit jobs can be waited for, like systemctl does
+        manager = DBusAddress(SYSTEMD_PATH, bus_name=SYSTEMD_BUS_NAME, interface=SYSTEMD_MANAGER_INTERFACE)
+        try:
+            _unwrap(connection.send_and_get_reply(
+                message_bus.AddMatch(_job_removed_rule(sender=SYSTEMD_BUS_NAME)), timeout=SYSTEMD_CALL_TIMEOUT
+            ))
+            _unwrap(connection.send_and_get_reply(
+                new_method_call(manager, 'Subscribe'), timeout=SYSTEMD_CALL_TIMEOUT
+            ))
+        except (OSError, SystemdBusError) as e:
+            connection.close()
+            raise SystemdBusUnavailable(f"systemd not reachable on the session bus: {e}") from e
+
+        _bus_connection = connection
+    return _bus_connection
+
+
+def _job_removed_rule(sender: str | None = None):
+    """
+    Match rule for the systemd manager's JobRemoved signal
+    :param sender: bus name to match, only for AddMatch - received signals carry
+        systemd's unique name, so local filters must leave it out
+    """
+    return MatchRule(
+        type='signal',
+        sender=sender,
+        interface=SYSTEMD_MANAGER_INTERFACE,
+        member='JobRemoved',
+        path=SYSTEMD_PATH
+    )
+
+
+def _unwrap(reply) -> tuple:
+    """Return a reply's body, raising SystemdBusError for error replies"""
+    try:
+        return unwrap_msg(reply)
+    except DBusErrorResponse as e:
+        raise SystemdBusError(e) from e
+
+
+def _drop_connection():
+    """Close the shared connection so the next call reconnects. Caller holds _bus_lock"""
+    global _bus_connection
+    if _bus_connection is not None:
+        try:
+            _bus_connection.close()
+        except OSError:
+            pass
+        _bus_connection = None
+
+
+def _send(message) -> tuple:
+    """Send a message on the shared connection and unwrap the reply"""
+    with _bus_lock:
+        connection = _get_connection()
+        try:
+            reply = connection.send_and_get_reply(message, timeout=SYSTEMD_CALL_TIMEOUT)
+        except OSError:
+            # Includes TimeoutError. systemd may have received the call,
+            # so it must not be retried through systemctl
+            _drop_connection()
+            raise
+
+    return _unwrap(reply)
+
+
+def _run_job(method: str, body: tuple[str, str]):
+    """
+    Queue a StartUnit/StopUnit/RestartUnit job and block until systemd
+    has finished it, as systemctl does
+    :raises SystemdBusUnavailable: if no connection could be opened
+    :raises OSError: if the call failed or the job didn't finish in time
+    :raises SystemdBusError: if systemd rejected the call or the job failed
+    """
+    if open_dbus_connection is None:
+        raise SystemdBusUnavailable("jeepney is not installed")
+
+    unit_name = body[0]
+    manager = DBusAddress(SYSTEMD_PATH, bus_name=SYSTEMD_BUS_NAME, interface=SYSTEMD_MANAGER_INTERFACE)
+    message = new_method_call(manager, method, 'ss', body)
+
+    with _bus_lock:
+        connection = _get_connection()
+        # Filter before sending, JobRemoved can arrive before the method reply.
+        # Whichever thread reads the signal off the socket dispatches it here
+        removed_jobs = connection.filter(_job_removed_rule(), bufsize=64)
+
+    try:
+        with _bus_lock:
+            job_path = _unwrap(connection.send_and_get_reply(message, timeout=SYSTEMD_CALL_TIMEOUT))[0]
+
+        # Only hold the lock for non-blocking reads, so status queries from
+        # the GUI thread aren't stuck behind a slow start/stop
+        deadline = time.monotonic() + SYSTEMD_CALL_TIMEOUT
+        result = None
+        while True:
+            with _bus_lock:
+                if _bus_connection is not connection:
+                    raise ConnectionError("D-Bus connection was closed while waiting for the job")
+                try:
+                    connection.recv_messages(timeout=0)
+                except TimeoutError:
+                    pass
+                while removed_jobs.queue:
+                    _job_id, removed_path, _unit, job_result = removed_jobs.queue.popleft().body
+                    if removed_path == job_path:
+                        result = job_result
+                        break
+            if result is not None:
+                break
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"{method} job for {unit_name} didn't finish in time")
+            try:
+                select.select([connection.sock], [], [], min(JOB_POLL_INTERVAL, remaining))
+            except (OSError, ValueError):
+                # Closed by another thread, caught by the check above
+                pass
+    except OSError:
+        # Includes TimeoutError, see _send
+        with _bus_lock:
+            if _bus_connection is connection:
+                _drop_connection()
+        raise
+    finally:
+        with _bus_lock:
+            removed_jobs.close()
+
+    if result != 'done':
+        raise SystemdBusError(f"{method} job for {unit_name} finished with result '{result}'")
+
+
+def _run_systemd(method: str, signature: str, body: tuple, systemctl_args: list[str],
+                 wait_for_job: bool = False) -> bool:
+    """
+    Run a systemd manager method over D-Bus, falling back to systemctl
+    :param systemctl_args: equivalent `systemctl --user` arguments
+    :param wait_for_job: method queues a unit job (body is (unit, mode)), wait until it's done
+    :return: True if successful, False otherwise
+    """
+    try:
+        if wait_for_job:
+            _run_job(method, body)
+        else:
+            _systemd_call(method, signature, body)
+        return True
+    except (SystemdBusError, OSError) as e:
+        print(f"{method} failed: {e!r}")
+        return False
+    except SystemdBusUnavailable:
+        pass
+
+    try:
+        subprocess.run(['systemctl', '--user', *systemctl_args], check=True)
+        return True
+    except subprocess.CalledProcessError as e:
+        print(e)
+        return False
+
 
 class SystemdManager:
     """Handles systemd service management"""
@@ -58,49 +308,90 @@ class SystemdManager:
     def reload_daemon() -> bool:
         """Reload systemd daemon"""
         try:
-            subprocess.run(['systemctl', '--user', 'daemon-reload'], check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            return _run_systemd('Reload', '', (), ['daemon-reload'])
+        finally:
+            _invalidate_status_cache()
 
     @staticmethod
     def enable_service() -> bool:
         """Enable the service to start automatically on login"""
         try:
-            subprocess.run(['systemctl', '--user', 'enable', SystemdManager.service_name], check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+            # systemctl enable reloads the daemon afterwards, so do the same
+            return (
+                _run_systemd('EnableUnitFiles', 'asbb', ([SystemdManager.service_name], False, False),
+                             ['enable', SystemdManager.service_name])
+                and _run_systemd('Reload', '', (), ['daemon-reload'])
+            )
+        finally:
+            _invalidate_status_cache()
 
     @staticmethod
     def disable_service() -> bool:
         """Disable the service from starting automatically"""
         try:
-            subprocess.run(['systemctl', '--user', 'disable', SystemdManager.service_name], check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(e)
-            return False
+            return (
+                _run_systemd('DisableUnitFiles', 'asb', ([SystemdManager.service_name], False),
+                             ['disable', SystemdManager.service_name])
+                and _run_systemd('Reload', '', (), ['daemon-reload'])
+            )
+        finally:
+            _invalidate_status_cache()
 
     @staticmethod
     def start_service() -> bool:
         """Start the service immediately"""
         try:
-            subprocess.run(['systemctl', '--user', 'start', SystemdManager.service_name], check=True)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(e)
-            return False
+            return _run_systemd('StartUnit', 'ss', (SystemdManager.service_name, 'replace'),
+                                ['start', SystemdManager.service_name], wait_for_job=True)
+        finally:
+            _invalidate_status_cache()
 
     @staticmethod
     def stop_service() -> bool:
         """Stop the running service"""
         try:
-            subprocess.run(['systemctl', '--user', 'stop', SystemdManager.service_name], check=True)
+            return _run_systemd('StopUnit', 'ss', (SystemdManager.service_name, 'replace'),
+                                ['stop', SystemdManager.service_name], wait_for_job=True)
+        finally:
+            _invalidate_status_cache()
+
+    @staticmethod
+    def reload_enable_restart_service() -> bool:
+        """
+        Enable the service, reload the daemon and (re)start it
+        :return: True if successful, False otherwise
+        """
+        service_name = SystemdManager.service_name
+        try:
+            # Enabling only creates symlinks on disk, so a single Reload
+            # afterwards picks up both them and the rewritten unit file
+            _systemd_call('EnableUnitFiles', 'asbb', ([service_name], False, False))
+            _systemd_call('Reload')
+            _run_job('RestartUnit', (service_name, 'replace'))
+            return True
+        except (SystemdBusError, OSError) as e:
+            print(f"Failed to restart {service_name}: {e!r}")
+            return False
+        except SystemdBusUnavailable:
+            pass
+        finally:
+            _invalidate_status_cache()
+
+        # Without D-Bus, batch the systemctl calls into a single shell invocation
+        service_name = shlex.quote(SystemdManager.service_name)
+        command = (
+            f"systemctl --user enable --no-reload {service_name}"
+            " && systemctl --user daemon-reload"
+            f" && systemctl --user restart {service_name}"
+        )
+        try:
+            subprocess.run(['sh', '-c', command], check=True)
             return True
         except subprocess.CalledProcessError as e:
             print(e)
             return False
+        finally:
+            _invalidate_status_cache()
 
     @staticmethod
     def get_service_status() -> dict:
@@ -112,6 +403,55 @@ class SystemdManager:
             - 'enabled': bool - whether service starts on boot
             - 'status': str - raw status string (active, inactive, failed, etc.)
         """
+        global _status_cache
+        with _status_lock:
+            cached = _status_cache
+            generation = _status_generation
+        if cached is not None and time.monotonic() - cached[0] < STATUS_CACHE_TTL:
+            return dict(cached[1])
+
+        try:
+            result = SystemdManager._get_bus_service_status()
+        except SystemdBusUnavailable:
+            result = SystemdManager._get_systemctl_service_status()
+        except OSError as e:
+            print(e)
+            result = {'active': False, 'enabled': False, 'status': 'unknown'}
+
+        with _status_lock:
+            if generation == _status_generation:
+                _status_cache = (time.monotonic(), dict(result))
+        return result
+
+    @staticmethod
+    def _get_bus_service_status() -> dict:
+        """get_service_status over D-Bus, raises SystemdBusUnavailable if D-Bus can't be used"""
+        result = {
+            'active': False,
+            'enabled': False,
+            'status': 'unknown'
+        }
+
+        # Check if active, a unit that isn't loaded is inactive
+        try:
+            unit_path = _systemd_call('GetUnit', 's', (SystemdManager.service_name,))[0]
+            result['status'] = _get_unit_property(unit_path, 'ActiveState')
+        except SystemdBusError:
+            result['status'] = 'inactive'
+        result['active'] = result['status'] == 'active'
+
+        # Check if enabled (starts on boot)
+        try:
+            state = _systemd_call('GetUnitFileState', 's', (SystemdManager.service_name,))[0]
+            result['enabled'] = state in ENABLED_STATES
+        except SystemdBusError:
+            pass
+
+        return result
+
+    @staticmethod
+    def _get_systemctl_service_status() -> dict:
+        """get_service_status using systemctl subprocesses"""
         result = {
             'active': False,
             'enabled': False,
@@ -150,20 +490,11 @@ def apply_wallpaper(video_path: str) -> bool:
 
     :return: True if successful, False otherwise
     """
-    SystemdManager.stop_service()
-
     if not SystemdManager.create_service(video_path):
         return False
 
-    SystemdManager.reload_daemon()
-
-    if not SystemdManager.enable_service():
-        return False
-
-    if not SystemdManager.start_service():
-        return False
-
-    return True
+    # restart replaces the separate stop + start
+    return SystemdManager.reload_enable_restart_service()
 
 
 def save_volume(volume: int) -> bool:
@@ -187,8 +518,6 @@ def get_volume() -> int:
     :return: volume
     """
     try:
-        if VOLUME_FILE.exists():
-            return int(VOLUME_FILE.read_text().strip())
-    except (ValueError, OSError):
-        pass
-    return 50
+        return int(VOLUME_FILE.read_bytes())
+    except (FileNotFoundError, ValueError, OSError):
+        return 50